@@ -1,4 +1,5 @@
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
 
@@ -9,6 +10,15 @@ class Settings(BaseSettings):
     ENVIRONMENT: str = "development"
     DEBUG: bool = True
 
+    # Worker threads for sync endpoints and dependencies (database I/O)
+    THREADPOOL_SIZE: int = 40
+
+    # Database connection pool
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = False  # Ping connections on checkout (one extra round-trip)
+
     API_V1_PREFIX: str = "/api/v1"
     PROJECT_NAME: str = "Polito-Log API"
     VERSION: str = "1.0.0"
@@ -21,16 +31,32 @@ class Settings(BaseSettings):
 
     # Magic Link Settings
     MAGIC_LINK_EXPIRE_MINUTES: int = 15  # Magic links expire in 15 minutes
+    MAGIC_LINK_DEBOUNCE_SECONDS: int = 30  # Repeat requests for the same email within this window are not re-sent
+    MAGIC_LINK_CLEANUP_INTERVAL_SECONDS: int = 60  # How often expired magic links are purged (0 disables)
+    MAGIC_LINK_CLEANUP_GRACE_MINUTES: int = 60  # Keep expired links this long before purging
     FRONTEND_URL: str = "http://localhost:5173"  # Frontend URL for magic links
 
     # Email Settings
     BREVO_API_KEY: Optional[str] = None  # Brevo (Sendinblue) API key for production emails
     BREVO_SENDER_EMAIL: str = "noreply@polito-log.lt"  # Sender email address
     BREVO_SENDER_NAME: str = "Polito-Log"  # Sender name
+    EMAIL_SEND_CONCURRENCY: int = 5  # Max emails in flight to the provider per process
+
+    # Frozen: settings are read-only after startup
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, frozen=True)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get application settings.
+    Settings are read from the environment and .env once per process;
+    call get_settings.cache_clear() to force a reload.
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    Returns:
+        Settings instance
+    """
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
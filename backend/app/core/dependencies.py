@@ -1,58 +1,124 @@
+from datetime import datetime
 from typing import Optional
-from fastapi import Depends, HTTPException, status, Header
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import Depends, HTTPException, Request, status, Header
+from fastapi.openapi.models import HTTPBearer as HTTPBearerModel
+from fastapi.security.base import SecurityBase
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.user import User
 from app.repositories.user import UserRepository
-from app.core.security import decode_access_token
+from app.core.security import decode_access_token, token_digest
 from app.core.email import EmailSender, get_email_sender as get_email_sender_factory
 
+
+def _parse_bearer(authorization: Optional[str]) -> Optional[str]:
+    """
+    Extract the token from an Authorization header value.
+
+    Args:
+        authorization: Authorization header value ("Bearer <token>")
+
+    Returns:
+        Token string or None if the header is missing or not a Bearer header
+    """
+    if not authorization or authorization[:7].lower() != "bearer ":
+        return None
+    return authorization[7:].strip() or None
+
+
+class BearerTokenAuth(SecurityBase):
+    """
+    Lightweight Bearer token extractor.
+    Returns the raw token string without building intermediate credential
+    objects, while still registering the security scheme in OpenAPI.
+    """
+
+    def __init__(self, scheme_name: str, description: Optional[str] = None):
+        """
+        Initialize Bearer token extractor.
+
+        Args:
+            scheme_name: Security scheme name used in OpenAPI
+            description: Security scheme description
+        """
+        self.model = HTTPBearerModel(description=description)
+        self.scheme_name = scheme_name
+
+    async def __call__(self, request: Request) -> str:
+        token = _parse_bearer(request.headers.get("authorization"))
+        if not token:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Not authenticated",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        # Hash once; downstream caches reuse request.state.token_sha
+        request.state.token_sha = token_digest(token)
+        return token
+
+
 # Security scheme for OpenAPI documentation
-bearer_scheme = HTTPBearer(
+bearer_scheme = BearerTokenAuth(
     scheme_name="BearerAuth",
     description="JWT Bearer token authentication"
 )
 
 
+async def request_now() -> datetime:
+    """
+    Dependency providing the current UTC time for the request.
+    FastAPI caches dependency results per request, so every consumer sees
+    the same instant and the clock is read once.
+    Declared async so it runs on the event loop without a threadpool hop.
+
+    Returns:
+        Current naive UTC datetime
+    """
+    return datetime.utcnow()
+
+
 async def get_email_sender() -> EmailSender:
     """
     Dependency for getting email sender instance.
     Returns ConsoleEmailSender for development, BrevoEmailSender for production.
     Automatically selects based on ENVIRONMENT and BREVO_API_KEY settings.
+    The same instance is shared across requests (see get_email_sender factory).
     """
     return get_email_sender_factory()
 
 
-async def get_current_user_optional(
+def get_current_user_optional(
+    request: Request,
     authorization: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ) -> Optional[User]:
     """
     Get current user from JWT token in Authorization header (optional).
     Returns None if no token or invalid token.
+    Declared sync so the user lookup runs in the threadpool, not the event loop.
 
     Args:
+        request: Incoming request
         authorization: Authorization header value
         db: Database session
 
     Returns:
         User instance or None
     """
-    if not authorization:
-        return None
+    # Reuse the user already resolved for this request
+    user = getattr(request.state, "user", None)
+    if user is not None:
+        return user
 
     # Extract token from "Bearer <token>"
-    try:
-        scheme, token = authorization.split()
-        if scheme.lower() != "bearer":
-            return None
-    except ValueError:
+    token = _parse_bearer(authorization)
+    if not token:
         return None
 
     # Decode token
-    payload = decode_access_token(token)
+    request.state.token_sha = token_digest(token)
+    payload = decode_access_token(token, digest=request.state.token_sha)
     if not payload:
         return None
 
@@ -66,27 +132,29 @@ async def get_current_user_optional(
     except ValueError:
         return None
 
-    # Get user from database
-    user_repo = UserRepository(db)
-    user = user_repo.get_by_id(user_id)
-
-    if not user or not user.is_active:
+    # Get user from cache or database
+    user = UserRepository(db).get_active_by_id(user_id)
+    if not user:
         return None
 
+    request.state.user = user
     return user
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+def get_current_user(
+    request: Request,
+    token: str = Depends(bearer_scheme),
     db: Session = Depends(get_db)
 ) -> User:
     """
     Get current user from JWT Bearer token (required).
     Raises 401 if not authenticated.
     This dependency is integrated with OpenAPI security for Swagger UI.
+    Declared sync so the user lookup runs in the threadpool, not the event loop.
 
     Args:
-        credentials: Bearer token credentials from Authorization header
+        request: Incoming request
+        token: Bearer token from Authorization header
         db: Database session
 
     Returns:
@@ -95,8 +163,13 @@ async def get_current_user(
     Raises:
         HTTPException: If not authenticated or token is invalid
     """
+    # Reuse the user already resolved for this request
+    user = getattr(request.state, "user", None)
+    if user is not None:
+        return user
+
     # Decode token
-    payload = decode_access_token(credentials.credentials)
+    payload = decode_access_token(token, digest=request.state.token_sha)
     if not payload:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -122,17 +195,16 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Get user from database
-    user_repo = UserRepository(db)
-    user = user_repo.get_by_id(user_id)
-
-    if not user or not user.is_active:
+    # Get user from cache or database
+    user = UserRepository(db).get_active_by_id(user_id)
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found or inactive",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    request.state.user = user
     return user
 
 
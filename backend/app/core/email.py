@@ -1,11 +1,67 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from contextlib import suppress
+from functools import lru_cache
+from string import Template
+from typing import List, Optional, Tuple
+import asyncio
 import logging
-import sib_api_v3_sdk
-from sib_api_v3_sdk.rest import ApiException
 
 logger = logging.getLogger(__name__)
 
+BREVO_API_URL = "https://api.brevo.com/v3"
+
+# Magic link email bodies, parsed once; only $greeting and $magic_link vary per email
+_MAGIC_LINK_HTML = Template("""\
+<!DOCTYPE html>
+<html>
+<head>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+        .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+        .button {
+            display: inline-block;
+            padding: 12px 24px;
+            background-color: #4CAF50;
+            color: white !important;
+            text-decoration: none;
+            border-radius: 4px;
+            margin: 20px 0;
+        }
+        .footer { margin-top: 30px; font-size: 12px; color: #666; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h2>Login to Polito-Log</h2>
+        <p>$greeting</p>
+        <p>Click the button below to securely log in to your Polito-Log account:</p>
+        <a href="$magic_link" class="button">Log In</a>
+        <p>Or copy and paste this link into your browser:</p>
+        <p><a href="$magic_link">$magic_link</a></p>
+        <p>This link will expire in 15 minutes for security reasons.</p>
+        <div class="footer">
+            <p>If you didn't request this login link, you can safely ignore this email.</p>
+            <p>&copy; Polito-Log - Tracking Political Accountability</p>
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+_MAGIC_LINK_TEXT = Template("""\
+$greeting
+
+Click the link below to securely log in to your Polito-Log account:
+
+$magic_link
+
+This link will expire in 15 minutes for security reasons.
+
+If you didn't request this login link, you can safely ignore this email.
+
+© Polito-Log - Tracking Political Accountability
+""")
+
 
 class EmailSender(ABC):
     """Abstract base class for email sending implementations."""
@@ -30,6 +86,14 @@ class EmailSender(ABC):
         """
         pass
 
+    async def start(self) -> None:
+        """Start any background work the sender needs (called at startup)."""
+        return None
+
+    async def aclose(self) -> None:
+        """Release any resources (e.g. HTTP connections) held by the sender."""
+        return None
+
 
 class ConsoleEmailSender(EmailSender):
     """
@@ -81,11 +145,15 @@ class BrevoEmailSender(EmailSender):
         self.sender_email = sender_email
         self.sender_name = sender_name
 
-        # Configure Brevo API client
-        configuration = sib_api_v3_sdk.Configuration()
-        configuration.api_key['api-key'] = api_key
-        self.api_instance = sib_api_v3_sdk.TransactionalEmailsApi(
-            sib_api_v3_sdk.ApiClient(configuration)
+        # Imported lazily so processes using the console sender never load it
+        import httpx
+
+        # Persistent async client: keeps TLS connections to Brevo alive
+        # across emails and never blocks the event loop
+        self._client = httpx.AsyncClient(
+            base_url=BREVO_API_URL,
+            headers={"api-key": api_key, "accept": "application/json"},
+            timeout=10.0
         )
 
     async def send_magic_link(
@@ -109,85 +177,220 @@ class BrevoEmailSender(EmailSender):
             # Prepare email content
             greeting = f"Hello {username}," if username else "Hello,"
 
-            html_content = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <style>
-                    body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                    .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                    .button {{
-                        display: inline-block;
-                        padding: 12px 24px;
-                        background-color: #4CAF50;
-                        color: white !important;
-                        text-decoration: none;
-                        border-radius: 4px;
-                        margin: 20px 0;
-                    }}
-                    .footer {{ margin-top: 30px; font-size: 12px; color: #666; }}
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <h2>Login to Polito-Log</h2>
-                    <p>{greeting}</p>
-                    <p>Click the button below to securely log in to your Polito-Log account:</p>
-                    <a href="{magic_link}" class="button">Log In</a>
-                    <p>Or copy and paste this link into your browser:</p>
-                    <p><a href="{magic_link}">{magic_link}</a></p>
-                    <p>This link will expire in 15 minutes for security reasons.</p>
-                    <div class="footer">
-                        <p>If you didn't request this login link, you can safely ignore this email.</p>
-                        <p>&copy; Polito-Log - Tracking Political Accountability</p>
-                    </div>
-                </div>
-            </body>
-            </html>
-            """
-
-            text_content = f"""
-            {greeting}
-
-            Click the link below to securely log in to your Polito-Log account:
-
-            {magic_link}
-
-            This link will expire in 15 minutes for security reasons.
-
-            If you didn't request this login link, you can safely ignore this email.
-
-            © Polito-Log - Tracking Political Accountability
-            """
-
-            # Create email object
-            send_smtp_email = sib_api_v3_sdk.SendSmtpEmail(
-                to=[{"email": to_email}],
-                sender={"email": self.sender_email, "name": self.sender_name},
-                subject="Your Polito-Log Login Link",
-                html_content=html_content,
-                text_content=text_content,
-            )
+            html_content = _MAGIC_LINK_HTML.substitute(greeting=greeting, magic_link=magic_link)
+            text_content = _MAGIC_LINK_TEXT.substitute(greeting=greeting, magic_link=magic_link)
 
             # Send the email
-            api_response = self.api_instance.send_transac_email(send_smtp_email)
-            logger.info(f"Magic link email sent successfully to {to_email}. Message ID: {api_response.message_id}")
+            response = await self._client.post(
+                "/smtp/email",
+                json={
+                    "to": [{"email": to_email}],
+                    "sender": {"email": self.sender_email, "name": self.sender_name},
+                    "subject": "Your Polito-Log Login Link",
+                    "htmlContent": html_content,
+                    "textContent": text_content,
+                }
+            )
+            if response.is_error:
+                logger.error(
+                    f"Brevo API error sending email to {to_email}: "
+                    f"{response.status_code} {response.text}"
+                )
+                return False
+
+            message_id = response.json().get("messageId")
+            logger.info(f"Magic link email sent successfully to {to_email}. Message ID: {message_id}")
             return True
 
-        except ApiException as e:
-            logger.error(f"Brevo API error sending email to {to_email}: {e}")
-            return False
         except Exception as e:
             logger.error(f"Unexpected error sending email to {to_email}: {e}")
             return False
 
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
+
+
+class QueuedEmailSender(EmailSender):
+    """
+    Email sender that delivers emails from a background worker.
+    send_magic_link only enqueues the email and returns, so requests never
+    wait on the email provider. The worker collects emails arriving within
+    a short window and delivers each batch through the wrapped sender,
+    reusing its connection. Emails within a batch are sent concurrently, with
+    at most max_concurrency requests in flight to the provider at once.
+    The queue is bounded: when it is full, emails are sent directly instead,
+    so a stalled provider slows requests down rather than growing memory.
+    """
+
+    def __init__(
+        self,
+        sender: EmailSender,
+        batch_window: float = 0.05,
+        max_batch_size: int = 50,
+        max_concurrency: int = 5,
+        max_queue_size: int = 1000,
+        shutdown_timeout: float = 10.0
+    ):
+        """
+        Initialize queued email sender.
+
+        Args:
+            sender: Email sender that performs the actual delivery
+            batch_window: Seconds to wait for more emails after the first one
+            max_batch_size: Maximum number of emails delivered per batch
+            max_concurrency: Maximum number of emails being sent at once
+            max_queue_size: Maximum number of emails waiting for delivery
+            shutdown_timeout: Seconds aclose waits for pending emails to be delivered
+        """
+        self.sender = sender
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.max_concurrency = max_concurrency
+        self.max_queue_size = max_queue_size
+        self.shutdown_timeout = shutdown_timeout
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def start(self) -> None:
+        """Start the delivery worker on the running event loop."""
+        await self.sender.start()
+        if self._worker is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._worker = asyncio.create_task(self._run())
+
+    async def send_magic_link(
+        self,
+        to_email: str,
+        magic_link: str,
+        username: Optional[str] = None
+    ) -> bool:
+        """
+        Queue a magic link email for delivery.
+        Falls back to sending directly when the worker is not running or the
+        queue is full.
+
+        Args:
+            to_email: Recipient email address
+            magic_link: The full magic link URL
+            username: Optional username for personalization
 
+        Returns:
+            bool: True if the email was queued or sent, False otherwise
+        """
+        if self._worker is None or self._worker.done():
+            return await self._send_direct(to_email, magic_link, username)
+        try:
+            self._queue.put_nowait((to_email, magic_link, username))
+        except asyncio.QueueFull:
+            logger.warning(f"Email queue full ({self.max_queue_size}), sending to {to_email} directly")
+            return await self._send_direct(to_email, magic_link, username)
+        return True
+
+    async def _send_direct(
+        self,
+        to_email: str,
+        magic_link: str,
+        username: Optional[str]
+    ) -> bool:
+        """
+        Send an email without queueing it, within the concurrency limit
+        shared with the worker (when the sender has been started).
+
+        Args:
+            to_email: Recipient email address
+            magic_link: The full magic link URL
+            username: Optional username for personalization
+
+        Returns:
+            bool: True if email was sent successfully, False otherwise
+        """
+        if self._semaphore is None:
+            return await self.sender.send_magic_link(to_email, magic_link, username)
+        async with self._semaphore:
+            return await self.sender.send_magic_link(to_email, magic_link, username)
+
+    async def _run(self) -> None:
+        """Drain the queue in batches until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._deliver(batch)
+
+    async def _deliver(self, batch: List[Tuple[str, str, Optional[str]]]) -> None:
+        """
+        Deliver a batch of queued emails.
+
+        Args:
+            batch: Queued (to_email, magic_link, username) tuples
+        """
+        await asyncio.gather(*(self._deliver_one(*email) for email in batch))
+
+    async def _deliver_one(
+        self,
+        to_email: str,
+        magic_link: str,
+        username: Optional[str]
+    ) -> None:
+        """
+        Deliver a single queued email, bounded by the concurrency limit.
+
+        Args:
+            to_email: Recipient email address
+            magic_link: The full magic link URL
+            username: Optional username for personalization
+        """
+        try:
+            async with self._semaphore:
+                await self.sender.send_magic_link(to_email, magic_link, username)
+        except Exception as e:
+            logger.error(f"Unexpected error delivering queued email to {to_email}: {e}")
+        finally:
+            self._queue.task_done()
+
+    async def aclose(self) -> None:
+        """
+        Deliver pending emails, stop the worker and close the wrapped sender.
+        Emails not delivered within shutdown_timeout seconds are dropped.
+        """
+        if self._worker is not None:
+            if not self._worker.done():
+                try:
+                    await asyncio.wait_for(self._queue.join(), self.shutdown_timeout)
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        f"Email queue not drained within {self.shutdown_timeout}s, "
+                        "dropping undelivered emails"
+                    )
+            self._worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+            self._queue = None
+            self._semaphore = None
+        await self.sender.aclose()
+
+
+@lru_cache(maxsize=1)
 def get_email_sender() -> EmailSender:
     """
     Factory function to get the appropriate email sender based on environment.
+    The sender is built once per process and reused for every request.
 
     Returns:
-        EmailSender: ConsoleEmailSender for development, BrevoEmailSender for production
+        EmailSender: ConsoleEmailSender for development, BrevoEmailSender
+        (delivered through a QueuedEmailSender) for production
 
     Usage:
         from app.core.email import get_email_sender
@@ -200,10 +403,13 @@ def get_email_sender() -> EmailSender:
     # Use Brevo in production if API key is configured
     if settings.ENVIRONMENT == "production" and settings.BREVO_API_KEY:
         logger.info("Using BrevoEmailSender for production email delivery")
-        return BrevoEmailSender(
-            api_key=settings.BREVO_API_KEY,
-            sender_email=settings.BREVO_SENDER_EMAIL,
-            sender_name=settings.BREVO_SENDER_NAME
+        return QueuedEmailSender(
+            BrevoEmailSender(
+                api_key=settings.BREVO_API_KEY,
+                sender_email=settings.BREVO_SENDER_EMAIL,
+                sender_name=settings.BREVO_SENDER_NAME
+            ),
+            max_concurrency=settings.EMAIL_SEND_CONCURRENCY
         )
 
     # Use console sender for development or when Brevo is not configured
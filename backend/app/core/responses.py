@@ -0,0 +1,17 @@
+from typing import Any
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class UTCORJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse that writes UTC datetimes with a "Z" suffix.
+    Matches the format Pydantic uses for response models, so endpoints that
+    return rows directly serialize timestamps like every other endpoint.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+        )
@@ -1,10 +1,53 @@
+import base64
+import hashlib
+import hmac
+import json
+import re
 import secrets
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import timedelta
 from typing import Optional, Dict, Any
-from jose import jwt, JWTError
+from cachetools import TTLCache
+import jwt
+from jwt import InvalidTokenError as JWTError
 
 from app.config import settings
 
+# Verified JWT payloads keyed by SHA-256 of the raw token. Entries live at most
+# 30 seconds and are never served past the token's own "exp" claim.
+_jwt_cache: TTLCache = TTLCache(maxsize=10000, ttl=30)
+_jwt_cache_lock = threading.Lock()
+
+# The HS256 header and signing key never change at runtime, so they are
+# encoded once here instead of on every create_access_token() call.
+_HS256_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+_JWT_KEY = settings.JWT_SECRET_KEY.encode()
+
+# Magic link tokens are base64url strings (see generate_magic_link_token)
+_MAGIC_LINK_TOKEN_RE = re.compile(r"[A-Za-z0-9_\-]{21,}")
+
+
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as required by RFC 7515."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _encode_hs256(claims: Dict[str, Any]) -> str:
+    """
+    Sign claims as an HS256 JWT using the precomputed header and key.
+
+    Args:
+        claims: JSON-serializable claims to encode
+
+    Returns:
+        Encoded JWT token string
+    """
+    payload_b64 = _b64url(json.dumps(claims, separators=(",", ":")).encode())
+    signing_input = _HS256_HEADER_B64 + b"." + payload_b64
+    signature = hmac.new(_JWT_KEY, signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url(signature)).decode()
+
 
 def create_access_token(
     data: Dict[str, Any],
@@ -21,14 +64,16 @@ def create_access_token(
         Encoded JWT token string
     """
     to_encode = data.copy()
+    now = int(time.time())
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        expire = now + settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+    to_encode.update({"exp": expire, "iat": now})
+    if settings.JWT_ALGORITHM == "HS256":
+        return _encode_hs256(to_encode)
 
-    to_encode.update({"exp": expire, "iat": datetime.utcnow()})
     encoded_jwt = jwt.encode(
         to_encode,
         settings.JWT_SECRET_KEY,
@@ -37,26 +82,80 @@ def create_access_token(
     return encoded_jwt
 
 
-def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
+def _peek_exp(token: str) -> Optional[int]:
+    """
+    Read the "exp" claim of a JWT without verifying its signature.
+    Only used to skip verification of tokens that would be rejected anyway.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        Expiration timestamp or None if the token cannot be parsed
+    """
+    try:
+        payload_b64 = token.split(".", 2)[1]
+        payload = json.loads(base64.urlsafe_b64decode(payload_b64 + "=" * (-len(payload_b64) % 4)))
+        exp = payload.get("exp")
+    except (IndexError, ValueError, AttributeError):
+        return None
+    return exp if isinstance(exp, (int, float)) else None
+
+
+def token_digest(token: str) -> bytes:
+    """
+    Compute the SHA-256 digest of a token.
+    Used as the verification cache key; compute it once per request and
+    pass it along instead of re-hashing the token.
+
+    Args:
+        token: Token string
+
+    Returns:
+        32-byte SHA-256 digest
+    """
+    return hashlib.sha256(token.encode()).digest()
+
+
+def decode_access_token(
+    token: str,
+    digest: Optional[bytes] = None
+) -> Optional[Dict[str, Any]]:
     """
     Decode and verify a JWT access token.
 
     Args:
         token: JWT token string
+        digest: Precomputed token_digest(token), if already available
 
     Returns:
         Decoded token payload or None if invalid
     """
+    key = digest if digest is not None else token_digest(token)
+    with _jwt_cache_lock:
+        payload = _jwt_cache.get(key)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+
+    # Expired tokens are rejected without paying for signature verification
+    exp = _peek_exp(token)
+    if exp is not None and exp <= time.time():
+        return None
+
     try:
         payload = jwt.decode(
             token,
             settings.JWT_SECRET_KEY,
             algorithms=[settings.JWT_ALGORITHM]
         )
-        return payload
     except JWTError:
         return None
 
+    # Only successful verifications are cached
+    with _jwt_cache_lock:
+        _jwt_cache[key] = payload
+    return payload
+
 
 def generate_magic_link_token() -> str:
     """
@@ -82,4 +181,4 @@ def verify_magic_link_token(token: str) -> bool:
     """
     # Basic validation - check if token is the right length and format
     # Actual verification happens by checking database
-    return len(token) > 20 and token.replace("-", "").replace("_", "").isalnum()
+    return _MAGIC_LINK_TOKEN_RE.fullmatch(token) is not None
@@ -6,13 +6,22 @@ from sqlalchemy.orm import sessionmaker, Session
 from app.config import settings
 
 
+# Sized for many short queries: LIFO checkout keeps a small set of connections
+# warm, and pool_recycle replaces stale ones instead of pinging every checkout
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_use_lifo=True,
     echo=settings.DEBUG
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Instances stay loaded after commit; models fetch server-generated columns
+# on INSERT/UPDATE (eager_defaults), so no re-SELECT is needed afterwards.
+# BaseRepository reloads only datetimes the caller set, so they match reads
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 Base = declarative_base()
 
@@ -1,9 +1,76 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+from datetime import timedelta
+from typing import AsyncIterator
+from anyio import to_thread
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
+from app.core.responses import UTCORJSONResponse
+from app.core.email import get_email_sender
 from app.routers import statement_router, auth_router
-from app.database import Base, engine
+from app.database import Base, SessionLocal, engine
+from app.repositories.magic_link import MagicLinkRepository
+
+logger = logging.getLogger(__name__)
+
+
+def _cleanup_expired_magic_links() -> int:
+    """
+    Delete magic links that expired more than the grace period ago.
+
+    Returns:
+        Number of deleted magic links
+    """
+    db = SessionLocal()
+    try:
+        grace = timedelta(minutes=settings.MAGIC_LINK_CLEANUP_GRACE_MINUTES)
+        return MagicLinkRepository(db).cleanup_expired(grace)
+    finally:
+        db.close()
+
+
+async def _sweep_expired_magic_links() -> None:
+    """Periodically purge expired magic links so the table stays small."""
+    while True:
+        await asyncio.sleep(settings.MAGIC_LINK_CLEANUP_INTERVAL_SECONDS)
+        try:
+            deleted = await run_in_threadpool(_cleanup_expired_magic_links)
+            if deleted:
+                logger.info(f"Deleted {deleted} expired magic links")
+        except Exception as e:
+            logger.error(f"Failed to delete expired magic links: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Application lifespan handler.
+    Runs once per worker process after startup, not at import time.
+
+    Args:
+        app: FastAPI application instance
+    """
+    # Sync endpoints and dependencies run their database work in this pool
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    # Create database tables
+    Base.metadata.create_all(bind=engine)
+    # Start background email delivery, if the sender uses it
+    await get_email_sender().start()
+    # Start the expired magic link sweeper
+    sweeper = None
+    if settings.MAGIC_LINK_CLEANUP_INTERVAL_SECONDS > 0:
+        sweeper = asyncio.create_task(_sweep_expired_magic_links())
+    yield
+    if sweeper is not None:
+        sweeper.cancel()
+        with suppress(asyncio.CancelledError):
+            await sweeper
+    # Flush pending emails and close outbound connections
+    await get_email_sender().aclose()
 
 
 def create_application() -> FastAPI:
@@ -19,7 +86,9 @@ def create_application() -> FastAPI:
         description=settings.DESCRIPTION,
         docs_url=f"{settings.API_V1_PREFIX}/docs",
         redoc_url=f"{settings.API_V1_PREFIX}/redoc",
-        openapi_url=f"{settings.API_V1_PREFIX}/openapi.json"
+        openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
+        default_response_class=UTCORJSONResponse,
+        lifespan=lifespan
     )
 
     # Configure OpenAPI security scheme
@@ -57,6 +126,7 @@ def create_application() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Total-Count", "X-Next-Cursor"],
     )
 
     # Include routers
@@ -66,9 +136,6 @@ def create_application() -> FastAPI:
     return app
 
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
-
 # Create application instance
 app = create_application()
 
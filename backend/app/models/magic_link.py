@@ -1,5 +1,6 @@
 from datetime import datetime
 from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -15,9 +16,11 @@ class MagicLink(Base):
     email: str = Column(String(255), nullable=False, index=True)
     user_id: int = Column(Integer, ForeignKey("users.id"), nullable=True)  # Null for new users
     is_used: bool = Column(Boolean, default=False, nullable=False)
-    expires_at: datetime = Column(DateTime(timezone=True), nullable=False)
+    expires_at: datetime = Column(DateTime(timezone=True), nullable=False, index=True)
     created_at: datetime = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     used_at: datetime = Column(DateTime(timezone=True), nullable=True)
 
+    user = relationship("User", back_populates="magic_links")
+
     def __repr__(self) -> str:
         return f"<MagicLink(id={self.id}, email={self.email}, is_used={self.is_used})>"
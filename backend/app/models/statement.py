@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Enum as SQLEnum
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Index, DDL, Enum as SQLEnum, event
+from sqlalchemy.sql import func, text
 import enum
 
 from app.database import Base
@@ -42,5 +42,57 @@ class Statement(Base):
         nullable=False
     )
 
+    # Fetch server-generated values (created_at, updated_at) with RETURNING on write
+    __mapper_args__ = {"eager_defaults": True}
+
+    __table_args__ = (
+        # The indexes below are PostgreSQL-only. create_all skips indexes on
+        # existing tables; deployed databases get them from sql/indexes.sql
+        # Partial indexes for the active-statement listings (filter + ORDER BY id)
+        Index(
+            "ix_statements_id_active", "id",
+            postgresql_where=text("is_active")
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_statements_politician_name_active", "politician_name", "id",
+            postgresql_where=text("is_active")
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_statements_party_active", "party", "id",
+            postgresql_where=text("is_active")
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_statements_status_active", "status", "id",
+            postgresql_where=text("is_active")
+        ).ddl_if(dialect="postgresql"),
+        # Trigram indexes so search_statements' ILIKE '%...%' avoids a sequential scan
+        Index(
+            "ix_statements_statement_text_trgm", "statement_text",
+            postgresql_using="gin",
+            postgresql_ops={"statement_text": "gin_trgm_ops"},
+            postgresql_where=text("is_active")
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_statements_politician_name_trgm", "politician_name",
+            postgresql_using="gin",
+            postgresql_ops={"politician_name": "gin_trgm_ops"},
+            postgresql_where=text("is_active")
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_statements_party_trgm", "party",
+            postgresql_using="gin",
+            postgresql_ops={"party": "gin_trgm_ops"},
+            postgresql_where=text("is_active")
+        ).ddl_if(dialect="postgresql"),
+    )
+
     def __repr__(self) -> str:
         return f"<Statement(id={self.id}, politician={self.politician_name}, party={self.party})>"
+
+
+# gin_trgm_ops comes from the pg_trgm extension, which must exist before the indexes
+event.listen(
+    Statement.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
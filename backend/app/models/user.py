@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Index
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -24,5 +25,19 @@ class User(Base):
         nullable=False
     )
 
+    magic_links = relationship("MagicLink", back_populates="user")
+
+    __table_args__ = (
+        # ix_users_username cannot serve LIKE 'prefix%' under a non-C collation;
+        # this one backs the username prefix lookup when verifying new users
+        Index(
+            "ix_users_username_pattern", "username",
+            postgresql_ops={"username": "varchar_pattern_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    # Fetch server-generated values (created_at, updated_at) with RETURNING on write
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email={self.email}, username={self.username})>"
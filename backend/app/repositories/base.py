@@ -1,12 +1,63 @@
-from typing import Generic, TypeVar, Type, Optional, List, Any, Dict
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from functools import lru_cache
+from typing import Callable, Generic, Iterable, TypeVar, Type, Optional, List, Any, Dict, Tuple
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy.sql.base import ExecutableOption
+from sqlalchemy import ColumnElement, DateTime, Row, Select, and_, func, insert, inspect, lambda_stmt, select
 
+from app.config import settings
 from app.database import Base
 
 
 ModelType = TypeVar("ModelType", bound=Base)
 
+# Outside production, entity reads attach raiseload("*"): touching a relationship
+# that was not loaded explicitly raises instead of silently lazy loading (N+1)
+STRICT_LOADING = settings.ENVIRONMENT != "production"
+
+
+def strict_loading(*options: ExecutableOption) -> List[ExecutableOption]:
+    """
+    Loader options for an entity read, adding raiseload("*") when STRICT_LOADING.
+    Relationships named in options still load as requested.
+
+    Args:
+        options: Loader options for the relationships the caller needs
+
+    Returns:
+        List of loader options
+    """
+    if STRICT_LOADING:
+        return [*options, raiseload("*")]
+    return list(options)
+
+
+@lru_cache(maxsize=None)
+def _model_columns(model: Type[Base]) -> Dict[str, Any]:
+    """
+    Filterable columns of a model by attribute name, built once per model.
+
+    Args:
+        model: SQLAlchemy model class
+
+    Returns:
+        Dictionary of attribute name to column
+    """
+    return {c.key: c for c in inspect(model).columns}
+
+
+@lru_cache(maxsize=None)
+def _datetime_columns(model: Type[Base]) -> Tuple[str, ...]:
+    """
+    Attribute names of a model's datetime columns, built once per model.
+
+    Args:
+        model: SQLAlchemy model class
+
+    Returns:
+        Tuple of attribute names
+    """
+    return tuple(c.key for c in inspect(model).columns if isinstance(c.type, DateTime))
+
 
 class BaseRepository(Generic[ModelType]):
     """Base repository class with common CRUD operations."""
@@ -22,6 +73,22 @@ class BaseRepository(Generic[ModelType]):
         self.model = model
         self.db = db
 
+    def _filter_conditions(self, filters: Optional[Dict[str, Any]]) -> List[ColumnElement[bool]]:
+        """
+        Build equality conditions for the given filters.
+        Keys that are not columns of the model are ignored.
+
+        Args:
+            filters: Dictionary of field:value pairs for filtering
+
+        Returns:
+            List of SQL conditions
+        """
+        if not filters:
+            return []
+        cols = _model_columns(self.model)
+        return [cols[key] == value for key, value in filters.items() if key in cols]
+
     def get_by_id(self, id: int) -> Optional[ModelType]:
         """
         Get a single record by ID.
@@ -32,7 +99,25 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Model instance or None if not found
         """
-        return self.db.query(self.model).filter(self.model.id == id).first()
+        # Session.get() consults the identity map first and only emits SQL
+        # when the record is not already loaded in this session
+        return self.db.get(self.model, id, options=strict_loading())
+
+    def get_many_by_ids(self, ids: Iterable[int]) -> Dict[int, ModelType]:
+        """
+        Get several records by ID with a single query.
+
+        Args:
+            ids: Record IDs
+
+        Returns:
+            Dictionary of ID -> model instance; missing IDs are absent
+        """
+        ids = list(ids)
+        if not ids:
+            return {}
+        stmt = select(self.model).options(*strict_loading()).where(self.model.id.in_(ids))
+        return {obj.id: obj for obj in self.db.scalars(stmt)}
 
     def get_all(
         self,
@@ -51,18 +136,73 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             List of model instances
         """
-        query = self.db.query(self.model)
+        model = self.model
+        stmt = lambda_stmt(lambda: select(model))
+        if STRICT_LOADING:
+            stmt += lambda s: s.options(raiseload("*"))
+
+        filter_conditions = self._filter_conditions(filters)
+        if filter_conditions:
+            stmt += lambda s: s.where(and_(*filter_conditions))
 
-        if filters:
-            filter_conditions = [
-                getattr(self.model, key) == value
-                for key, value in filters.items()
-                if hasattr(self.model, key)
-            ]
-            if filter_conditions:
-                query = query.filter(and_(*filter_conditions))
+        stmt += lambda s: s.offset(skip).limit(limit)
+        return list(self.db.execute(stmt).scalars())
 
-        return query.offset(skip).limit(limit).all()
+    def get_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[ModelType], int]:
+        """
+        Get a page of records together with the total number of matches.
+        The total is computed with COUNT(*) OVER () in the same query, so a
+        paginated listing costs one round-trip instead of get_all() + count().
+
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            filters: Dictionary of field:value pairs for filtering
+
+        Returns:
+            Tuple of (model instances, total number of matching records)
+        """
+        stmt = select(self.model).options(*strict_loading())
+
+        filter_conditions = self._filter_conditions(filters)
+        if filter_conditions:
+            stmt = stmt.where(and_(*filter_conditions))
+
+        rows, total = self._fetch_page(stmt, skip, limit, lambda: self.count(filters))
+        return [row[0] for row in rows], total
+
+    def _fetch_page(
+        self,
+        stmt: Select,
+        skip: int,
+        limit: int,
+        count: Callable[[], int]
+    ) -> Tuple[List[Row], int]:
+        """
+        Run a page of a select together with the total number of matches.
+        Adds a COUNT(*) OVER () "total" column to the select, so the page and
+        the total come back in one round-trip.
+
+        Args:
+            stmt: Select for the matching records, without offset or limit
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            count: Counts the matching records; only called for a page past the end
+
+        Returns:
+            Tuple of (result rows including the "total" column, total number of matches)
+        """
+        stmt = stmt.add_columns(func.count().over().label("total"))
+        rows = self.db.execute(stmt.offset(skip).limit(limit)).all()
+        if rows:
+            return rows, rows[0].total
+        # A page past the end carries no window total; count separately
+        return [], count() if skip else 0
 
     def create(self, obj: ModelType) -> ModelType:
         """
@@ -74,11 +214,34 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Created model instance
         """
+        # Server-generated columns come back via INSERT ... RETURNING
+        # (eager_defaults) and survive the commit; only datetimes set by the
+        # caller are reloaded, so they read back as stored
         self.db.add(obj)
+        assigned = self._assigned_datetimes(obj)
         self.db.commit()
-        self.db.refresh(obj)
+        if assigned:
+            self.db.refresh(obj, attribute_names=assigned)
         return obj
 
+    def create_many(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        Create several records with a single batched INSERT ... RETURNING.
+        Unlike create(), no model instances are loaded back.
+
+        Args:
+            rows: List of field:value dictionaries, one per record
+
+        Returns:
+            IDs of the created records, in the same order as rows
+        """
+        if not rows:
+            return []
+        stmt = insert(self.model).returning(self.model.id, sort_by_parameter_order=True)
+        ids = list(self.db.scalars(stmt, rows))
+        self.db.commit()
+        return ids
+
     def update(self, obj: ModelType) -> ModelType:
         """
         Update an existing record.
@@ -89,10 +252,30 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Updated model instance
         """
+        assigned = self._assigned_datetimes(obj)
         self.db.commit()
-        self.db.refresh(obj)
+        if assigned:
+            self.db.refresh(obj, attribute_names=assigned)
         return obj
 
+    def _assigned_datetimes(self, obj: ModelType) -> List[str]:
+        """
+        Datetime attributes given a new value in Python since the last flush.
+        Instances are not expired on commit, so these would otherwise keep the
+        caller's value (e.g. with its UTC offset) instead of the stored one.
+
+        Args:
+            obj: Model instance about to be committed
+
+        Returns:
+            List of attribute names to reload after the commit
+        """
+        state = inspect(obj)
+        return [
+            key for key in _datetime_columns(self.model)
+            if any(value is not None for value in state.attrs[key].history.added)
+        ]
+
     def delete(self, id: int) -> bool:
         """
         Delete a record by ID.
@@ -120,15 +303,11 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Number of records
         """
-        query = self.db.query(self.model)
+        # Plain SELECT count(*) FROM <table>, without the subquery Query.count() wraps
+        stmt = select(func.count()).select_from(self.model)
 
-        if filters:
-            filter_conditions = [
-                getattr(self.model, key) == value
-                for key, value in filters.items()
-                if hasattr(self.model, key)
-            ]
-            if filter_conditions:
-                query = query.filter(and_(*filter_conditions))
+        filter_conditions = self._filter_conditions(filters)
+        if filter_conditions:
+            stmt = stmt.where(and_(*filter_conditions))
 
-        return query.count()
+        return self.db.execute(stmt).scalar_one()
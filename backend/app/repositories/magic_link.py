@@ -1,9 +1,20 @@
+import threading
 from typing import Optional
-from datetime import datetime
-from sqlalchemy.orm import Session
+from datetime import datetime, timedelta
+from cachetools import TTLCache
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session, selectinload
 
 from app.models.magic_link import MagicLink
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, strict_loading
+
+# Tokens recently found to be invalid (unknown, used or expired). Repeated
+# guesses and replays are rejected without a database round-trip.
+_invalid_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=5)
+_invalid_token_cache_lock = threading.Lock()
+
+# Rows removed per DELETE when purging expired links, to keep locks short
+CLEANUP_BATCH_SIZE = 10000
 
 
 class MagicLinkRepository(BaseRepository[MagicLink]):
@@ -18,65 +29,101 @@ class MagicLinkRepository(BaseRepository[MagicLink]):
         """
         super().__init__(MagicLink, db)
 
-    def get_by_token(self, token: str) -> Optional[MagicLink]:
+    def create_link(
+        self,
+        token: str,
+        email: str,
+        user_id: Optional[int],
+        expires_at: datetime
+    ) -> MagicLink:
         """
-        Get magic link by token.
+        Create a magic link with a single INSERT ... RETURNING.
+        Skips the unit-of-work flush that create() goes through.
 
         Args:
             token: Magic link token
+            email: Email address the link is for
+            user_id: ID of the existing user, or None for a new user
+            expires_at: Expiration time
 
         Returns:
-            MagicLink instance or None if not found
+            Created MagicLink instance
         """
-        return self.db.query(MagicLink).filter(MagicLink.token == token).first()
+        stmt = (
+            insert(MagicLink)
+            .values(token=token, email=email, user_id=user_id, expires_at=expires_at)
+            .returning(MagicLink)
+        )
+        magic_link = self.db.execute(stmt).scalar_one()
+        self.db.commit()
+        return magic_link
 
-    def get_valid_by_token(self, token: str) -> Optional[MagicLink]:
+    def consume(self, token: str, now: Optional[datetime] = None) -> Optional[MagicLink]:
         """
-        Get valid (unused and not expired) magic link by token.
+        Atomically mark a valid (unused and not expired) magic link as used.
+        A single UPDATE ... RETURNING both checks and consumes the token, so
+        concurrent requests can never use the same link twice.
+        The change is not committed; the caller commits it together with
+        the rest of the login.
 
         Args:
             token: Magic link token
+            now: Current UTC time (defaults to the current time)
 
         Returns:
-            MagicLink instance or None if not found or invalid
+            The consumed MagicLink instance (with its user loaded) or None if
+            not found or invalid
         """
-        now = datetime.utcnow()
-        return (
-            self.db.query(MagicLink)
-            .filter(
+        with _invalid_token_cache_lock:
+            if token in _invalid_token_cache:
+                return None
+
+        if now is None:
+            now = datetime.utcnow()
+        stmt = (
+            update(MagicLink)
+            .where(
                 MagicLink.token == token,
                 MagicLink.is_used == False,
                 MagicLink.expires_at > now
             )
-            .first()
+            .values(is_used=True, used_at=now)
+            .returning(MagicLink)
+            # Load the owning user with the consume, not lazily afterwards
+            .options(*strict_loading(selectinload(MagicLink.user)))
+            .execution_options(synchronize_session=False)
         )
+        magic_link = self.db.execute(stmt).scalar_one_or_none()
+        if not magic_link:
+            with _invalid_token_cache_lock:
+                _invalid_token_cache[token] = True
+        return magic_link
 
-    def mark_as_used(self, magic_link: MagicLink) -> MagicLink:
+    def cleanup_expired(self, grace: timedelta = timedelta(0)) -> int:
         """
-        Mark a magic link as used.
+        Delete expired magic links.
+        Rows are removed in batches of CLEANUP_BATCH_SIZE, each committed
+        separately, so a large backlog never holds locks for long.
 
         Args:
-            magic_link: MagicLink instance to mark as used
-
-        Returns:
-            Updated MagicLink instance
-        """
-        magic_link.is_used = True
-        magic_link.used_at = datetime.utcnow()
-        return self.update(magic_link)
-
-    def cleanup_expired(self) -> int:
-        """
-        Delete expired magic links.
+            grace: Only delete links that expired at least this long ago
 
         Returns:
             Number of deleted records
         """
-        now = datetime.utcnow()
-        deleted = (
-            self.db.query(MagicLink)
-            .filter(MagicLink.expires_at < now)
-            .delete()
+        cutoff = datetime.utcnow() - grace
+        expired_ids = (
+            select(MagicLink.id)
+            .where(MagicLink.expires_at < cutoff)
+            .limit(CLEANUP_BATCH_SIZE)
+            .scalar_subquery()
         )
-        self.db.commit()
-        return deleted
+        stmt = delete(MagicLink).where(MagicLink.id.in_(expired_ids))
+
+        total = 0
+        while True:
+            deleted = self.db.execute(stmt, execution_options={"synchronize_session": False}).rowcount
+            self.db.commit()
+            total += deleted
+            if deleted < CLEANUP_BATCH_SIZE:
+                return total
@@ -1,10 +1,31 @@
-from typing import List, Optional
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from sqlalchemy import Select, or_, and_, select
 
 from app.repositories.base import BaseRepository
 from app.models.statement import Statement, StatementStatus
 
+# A statement row as returned by list queries: column name -> value
+StatementRow = Dict[str, Any]
+
+# Recent get_by_status() results, keyed by (cache version, status, skip, limit).
+# Statement writes bump the version, so results read before a write are never
+# served after it, even if they are stored concurrently with the write.
+_status_rows_cache: TTLCache = TTLCache(maxsize=64, ttl=10)
+# Statement totals, keyed by (cache version, active_only); same invalidation
+_count_cache: TTLCache = TTLCache(maxsize=8, ttl=10)
+_cache_lock = threading.Lock()
+_cache_version = 0
+
+
+def _invalidate_caches() -> None:
+    """Invalidate cached statement query results after a write."""
+    global _cache_version
+    with _cache_lock:
+        _cache_version += 1
+
 
 class StatementRepository(BaseRepository[Statement]):
     """Repository for Statement model with custom query methods."""
@@ -18,12 +39,37 @@ class StatementRepository(BaseRepository[Statement]):
         """
         super().__init__(Statement, db)
 
+    def _list_select(self) -> Select:
+        """
+        Base statement for list endpoints.
+        Selects plain columns instead of Statement entities, so rows come back
+        as dictionaries that the response schema validates directly, with no
+        per-attribute ORM access and no possibility of lazy loads.
+
+        Returns:
+            Select statement over all statement columns
+        """
+        return select(*Statement.__table__.columns)
+
+    def _fetch_rows(self, stmt: Select) -> List[StatementRow]:
+        """
+        Execute a list statement and return its rows as dictionaries.
+        Pages are bounded by limit, so the result is fetched in one round-trip.
+
+        Args:
+            stmt: Select statement built from _list_select()
+
+        Returns:
+            List of statement rows
+        """
+        return [dict(row) for row in self.db.execute(stmt).mappings()]
+
     def get_by_politician(
         self,
         politician_name: str,
         skip: int = 0,
         limit: int = 100
-    ) -> List[Statement]:
+    ) -> List[StatementRow]:
         """
         Get statements by politician name.
 
@@ -33,23 +79,23 @@ class StatementRepository(BaseRepository[Statement]):
             limit: Maximum number of records to return
 
         Returns:
-            List of Statement instances
+            List of statement rows
         """
-        return (
-            self.db.query(Statement)
-            .filter(Statement.politician_name == politician_name)
-            .filter(Statement.is_active == True)
+        stmt = (
+            self._list_select()
+            .where(and_(Statement.politician_name == politician_name, Statement.is_active == True))
+            .order_by(Statement.id)
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return self._fetch_rows(stmt)
 
     def get_by_party(
         self,
         party: str,
         skip: int = 0,
         limit: int = 100
-    ) -> List[Statement]:
+    ) -> List[StatementRow]:
         """
         Get statements by party.
 
@@ -59,25 +105,27 @@ class StatementRepository(BaseRepository[Statement]):
             limit: Maximum number of records to return
 
         Returns:
-            List of Statement instances
+            List of statement rows
         """
-        return (
-            self.db.query(Statement)
-            .filter(Statement.party == party)
-            .filter(Statement.is_active == True)
+        stmt = (
+            self._list_select()
+            .where(and_(Statement.party == party, Statement.is_active == True))
+            .order_by(Statement.id)
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return self._fetch_rows(stmt)
 
     def get_by_status(
         self,
         status: StatementStatus,
         skip: int = 0,
         limit: int = 100
-    ) -> List[Statement]:
+    ) -> List[StatementRow]:
         """
         Get statements by verification status.
+        Results are cached for a few seconds: there are only a handful of
+        statuses and the listing is the same for every user.
 
         Args:
             status: Statement status
@@ -85,23 +133,32 @@ class StatementRepository(BaseRepository[Statement]):
             limit: Maximum number of records to return
 
         Returns:
-            List of Statement instances
+            List of statement rows
         """
-        return (
-            self.db.query(Statement)
-            .filter(Statement.status == status)
-            .filter(Statement.is_active == True)
+        with _cache_lock:
+            key = (_cache_version, status, skip, limit)
+            rows = _status_rows_cache.get(key)
+        if rows is not None:
+            return list(rows)
+
+        stmt = (
+            self._list_select()
+            .where(and_(Statement.status == status, Statement.is_active == True))
+            .order_by(Statement.id)
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        rows = self._fetch_rows(stmt)
+        with _cache_lock:
+            _status_rows_cache[key] = rows
+        return list(rows)
 
     def search_statements(
         self,
         search_text: str,
         skip: int = 0,
         limit: int = 100
-    ) -> List[Statement]:
+    ) -> List[StatementRow]:
         """
         Search statements by text in statement_text, politician_name, or party.
 
@@ -111,12 +168,12 @@ class StatementRepository(BaseRepository[Statement]):
             limit: Maximum number of records to return
 
         Returns:
-            List of Statement instances
+            List of statement rows
         """
         search_pattern = f"%{search_text}%"
-        return (
-            self.db.query(Statement)
-            .filter(
+        stmt = (
+            self._list_select()
+            .where(
                 and_(
                     Statement.is_active == True,
                     or_(
@@ -128,14 +185,14 @@ class StatementRepository(BaseRepository[Statement]):
             )
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return self._fetch_rows(stmt)
 
     def get_active_statements(
         self,
         skip: int = 0,
         limit: int = 100
-    ) -> List[Statement]:
+    ) -> List[StatementRow]:
         """
         Get all active statements.
 
@@ -144,28 +201,199 @@ class StatementRepository(BaseRepository[Statement]):
             limit: Maximum number of records to return
 
         Returns:
-            List of Statement instances
+            List of statement rows
         """
-        return (
-            self.db.query(Statement)
-            .filter(Statement.is_active == True)
+        stmt = (
+            self._list_select()
+            .where(Statement.is_active == True)
+            .order_by(Statement.id)
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return self._fetch_rows(stmt)
 
-    def soft_delete(self, id: int) -> Optional[Statement]:
+    def get_all_statements(
+        self,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[StatementRow]:
+        """
+        Get all statements, including soft-deleted ones.
+
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of statement rows
+        """
+        stmt = self._list_select().order_by(Statement.id).offset(skip).limit(limit)
+        return self._fetch_rows(stmt)
+
+    def get_statements_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        active_only: bool = True
+    ) -> Tuple[List[StatementRow], int]:
+        """
+        Get a page of statements together with the total number of matches.
+        The total comes from COUNT(*) OVER () in the same query.
+
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            active_only: If True, only count and return active statements
+
+        Returns:
+            Tuple of (statement rows, total number of matching statements)
+        """
+        stmt = self._list_select()
+        if active_only:
+            stmt = stmt.where(Statement.is_active == True)
+        rows, total = self._fetch_page(
+            stmt.order_by(Statement.id), skip, limit, lambda: self.count_statements(active_only)
+        )
+        # Drop the window total from each row
+        return [{key: value for key, value in row._mapping.items() if key != "total"} for row in rows], total
+
+    def count_statements(self, active_only: bool = True) -> int:
+        """
+        Count statements, using a short-lived in-process cache.
+        Statement writes invalidate the cache, so counts are only ever stale
+        with respect to writes made by other processes.
+
+        Args:
+            active_only: If True, count only active statements
+
+        Returns:
+            Number of statements
+        """
+        with _cache_lock:
+            key = (_cache_version, active_only)
+            total = _count_cache.get(key)
+        if total is not None:
+            return total
+
+        total = self.count({"is_active": True} if active_only else None)
+        with _cache_lock:
+            _count_cache[key] = total
+        return total
+
+    def list_after(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 100,
+        active_only: bool = True
+    ) -> List[StatementRow]:
+        """
+        Get the next page of statements after a given ID (keyset pagination).
+        Seeks straight to the page through the index instead of scanning past
+        skipped rows, so deep pages cost the same as the first one.
+
+        Args:
+            after_id: ID of the last statement of the previous page (None for the first page)
+            limit: Maximum number of records to return
+            active_only: If True, return only active statements
+
+        Returns:
+            List of statement rows, ordered by ID
+        """
+        stmt = self._list_select()
+        if after_id is not None:
+            stmt = stmt.where(Statement.id > after_id)
+        if active_only:
+            stmt = stmt.where(Statement.is_active == True)
+        return self._fetch_rows(stmt.order_by(Statement.id).limit(limit))
+
+    def create(self, obj: Statement) -> Statement:
+        """
+        Create a new statement and invalidate cached query results.
+
+        Args:
+            obj: Statement instance to create
+
+        Returns:
+            Created Statement instance
+        """
+        obj = super().create(obj)
+        _invalidate_caches()
+        return obj
+
+    def create_many(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        Create several statements and invalidate cached query results.
+
+        Args:
+            rows: List of field:value dictionaries, one per statement
+
+        Returns:
+            IDs of the created statements, in the same order as rows
+        """
+        ids = super().create_many(rows)
+        _invalidate_caches()
+        return ids
+
+    def update(self, obj: Statement) -> Statement:
+        """
+        Update a statement and invalidate cached query results.
+
+        Args:
+            obj: Statement instance to update
+
+        Returns:
+            Updated Statement instance
+        """
+        obj = super().update(obj)
+        _invalidate_caches()
+        return obj
+
+    def delete(self, id: int) -> bool:
+        """
+        Hard delete a statement and invalidate cached query results.
+
+        Args:
+            id: Statement ID
+
+        Returns:
+            True if deleted, False if not found
+        """
+        deleted = super().delete(id)
+        if deleted:
+            _invalidate_caches()
+        return deleted
+
+    def soft_delete(self, id: int) -> bool:
         """
         Soft delete a statement by setting is_active to False.
+        Issues a single UPDATE without loading the statement first.
 
         Args:
             id: Statement ID
 
         Returns:
-            Updated Statement instance or None if not found
+            True if deleted, False if not found or already deleted
+        """
+        return self.soft_delete_many([id]) > 0
+
+    def soft_delete_many(self, ids: List[int]) -> int:
+        """
+        Soft delete several statements with a single UPDATE.
+
+        Args:
+            ids: Statement IDs
+
+        Returns:
+            Number of statements deleted
         """
-        statement = self.get_by_id(id)
-        if statement:
-            statement.is_active = False
-            return self.update(statement)
-        return None
+        if not ids:
+            return 0
+        rows = (
+            self.db.query(Statement)
+            .filter(Statement.id.in_(ids), Statement.is_active == True)
+            .update({Statement.is_active: False}, synchronize_session=False)
+        )
+        self.db.commit()
+        if rows:
+            _invalidate_caches()
+        return rows
@@ -1,8 +1,21 @@
-from typing import Optional
-from sqlalchemy.orm import Session
+import threading
+from typing import Optional, Set, Tuple
+from cachetools import TTLCache
+from sqlalchemy import Integer, and_, func, literal, or_, select, union_all
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from app.models.user import User
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, strict_loading
+
+# Column values of recently resolved active users, keyed by user ID.
+# Used by the authentication dependencies to skip the per-request lookup.
+_active_user_cache: TTLCache = TTLCache(maxsize=5000, ttl=60)
+_active_user_cache_lock = threading.Lock()
+
+# Email -> user ID for recently seen users. Emails never change, so entries
+# only need re-checking against the loaded user, not explicit invalidation.
+_email_to_id_cache: TTLCache = TTLCache(maxsize=10000, ttl=60)
+_email_to_id_cache_lock = threading.Lock()
 
 
 class UserRepository(BaseRepository[User]):
@@ -17,6 +30,48 @@ class UserRepository(BaseRepository[User]):
         """
         super().__init__(User, db)
 
+    def get_active_by_id(self, user_id: int) -> Optional[User]:
+        """
+        Get an active user by ID, using a short-lived in-process cache.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            User instance attached to the current session, or None if not
+            found or inactive
+        """
+        with _active_user_cache_lock:
+            snapshot = _active_user_cache.get(user_id)
+        if snapshot is not None:
+            user = User(**snapshot)
+            make_transient_to_detached(user)
+            return self.db.merge(user, load=False)
+
+        user = self.get_by_id(user_id)
+        if not user or not user.is_active:
+            return None
+
+        snapshot = {column.key: getattr(user, column.key) for column in User.__table__.columns}
+        with _active_user_cache_lock:
+            _active_user_cache[user_id] = snapshot
+        return user
+
+    def update(self, obj: User) -> User:
+        """
+        Update an existing user and drop it from the active user cache.
+
+        Args:
+            obj: User instance to update
+
+        Returns:
+            Updated User instance
+        """
+        user = super().update(obj)
+        with _active_user_cache_lock:
+            _active_user_cache.pop(user.id, None)
+        return user
+
     def get_by_email(self, email: str) -> Optional[User]:
         """
         Get user by email address.
@@ -27,7 +82,71 @@ class UserRepository(BaseRepository[User]):
         Returns:
             User instance or None if not found
         """
-        return self.db.query(User).filter(User.email == email).first()
+        with _email_to_id_cache_lock:
+            user_id = _email_to_id_cache.get(email)
+        if user_id is not None:
+            user = self.get_active_by_id(user_id)
+            if user and user.email == email:
+                return user
+
+        user = self.db.query(User).options(*strict_loading()).filter(User.email == email).first()
+        if user:
+            with _email_to_id_cache_lock:
+                _email_to_id_cache[email] = user.id
+        return user
+
+    def get_for_verification(
+        self,
+        email: str,
+        username_prefix: str
+    ) -> Tuple[Optional[User], Set[str]]:
+        """
+        Get the user for an email together with the usernames a new user could
+        collide with, in one round-trip.
+        The email probe and the username probe are separate branches of a
+        UNION ALL, each served by its own index, and only username strings
+        are loaded. Usernames are limited to the prefix itself and the prefix
+        followed by digits, the only candidates a new username is picked from.
+        When the user is already known, the cached lookup from get_by_email
+        is used instead.
+
+        Args:
+            email: Email address
+            username_prefix: Username a new user would get, before any numeric suffix
+
+        Returns:
+            Tuple of (User instance or None, set of taken usernames among
+            username_prefix and username_prefix + digits; empty when the user exists)
+        """
+        with _email_to_id_cache_lock:
+            user_id = _email_to_id_cache.get(email)
+        if user_id is not None:
+            user = self.get_active_by_id(user_id)
+            if user and user.email == email:
+                return user, set()
+
+        by_email = select(User.id, User.username).where(User.email == email)
+        by_username = select(literal(None, Integer), User.username).where(
+            or_(
+                User.username == username_prefix,
+                and_(
+                    User.username.startswith(username_prefix, autoescape=True),
+                    func.substr(User.username, len(username_prefix) + 1, 1).between("0", "9")
+                )
+            )
+        )
+        rows = self.db.execute(union_all(by_email, by_username)).all()
+
+        user_id = next((row[0] for row in rows if row[0] is not None), None)
+        if user_id is not None:
+            user = self.get_by_id(user_id)
+            with _email_to_id_cache_lock:
+                _email_to_id_cache[email] = user_id
+            return user, set()
+        return None, {
+            username for _, username in rows
+            if username == username_prefix or username[len(username_prefix):].isdigit()
+        }
 
     def get_by_username(self, username: str) -> Optional[User]:
         """
@@ -39,7 +158,7 @@ class UserRepository(BaseRepository[User]):
         Returns:
             User instance or None if not found
         """
-        return self.db.query(User).filter(User.username == username).first()
+        return self.db.query(User).options(*strict_loading()).filter(User.username == username).first()
 
     def get_active_users(self, skip: int = 0, limit: int = 100):
         """
@@ -54,6 +173,7 @@ class UserRepository(BaseRepository[User]):
         """
         return (
             self.db.query(User)
+            .options(*strict_loading())
             .filter(User.is_active)
             .offset(skip)
             .limit(limit)
@@ -11,10 +11,10 @@ from app.schemas.auth import (
     TokenVerify
 )
 from app.schemas.user import UserResponse, UserUpdate
-from app.core.dependencies import get_email_sender, get_current_user
+from app.core.dependencies import get_email_sender, get_current_user, request_now
 from app.core.email import EmailSender
 from app.models.user import User
-from app.config import settings
+from app.config import Settings, get_settings
 
 
 router = APIRouter(
@@ -39,7 +39,8 @@ def get_auth_service(
 )
 async def request_magic_link(
     request: MagicLinkRequest,
-    service: AuthService = Depends(get_auth_service)
+    service: AuthService = Depends(get_auth_service),
+    now: datetime = Depends(request_now)
 ) -> MagicLinkResponse:
     """
     Request a magic link for passwordless authentication.
@@ -49,6 +50,7 @@ async def request_magic_link(
     Args:
         request: Magic link request with email
         service: Auth service instance
+        now: Current UTC time for this request
 
     Returns:
         Response with success message
@@ -56,7 +58,7 @@ async def request_magic_link(
     Raises:
         HTTPException: 500 if failed to send email
     """
-    success, message = await service.request_magic_link(request.email)
+    success, message = await service.request_magic_link(request.email, now)
 
     if not success:
         raise HTTPException(
@@ -78,7 +80,9 @@ async def request_magic_link(
 )
 def verify_magic_link(
     token_verify: TokenVerify,
-    service: AuthService = Depends(get_auth_service)
+    service: AuthService = Depends(get_auth_service),
+    settings: Settings = Depends(get_settings),
+    now: datetime = Depends(request_now)
 ) -> TokenResponse:
     """
     Verify a magic link token and return a JWT access token.
@@ -87,6 +91,8 @@ def verify_magic_link(
     Args:
         token_verify: Token verification request
         service: Auth service instance
+        settings: Application settings
+        now: Current UTC time for this request
 
     Returns:
         JWT access token and user information
@@ -94,7 +100,7 @@ def verify_magic_link(
     Raises:
         HTTPException: 401 if token is invalid or expired
     """
-    result = service.verify_magic_link(token_verify.token)
+    result = service.verify_magic_link(token_verify.token, now)
 
     if not result:
         raise HTTPException(
@@ -105,7 +111,7 @@ def verify_magic_link(
     user, access_token = result
 
     # Calculate token expiration
-    expires_at = datetime.utcnow() + timedelta(
+    expires_at = now + timedelta(
         minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
     )
 
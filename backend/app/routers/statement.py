@@ -12,6 +12,7 @@ from app.schemas.statement import (
 from app.models.statement import StatementStatus
 from app.models.user import User
 from app.core.dependencies import get_current_user
+from app.core.responses import UTCORJSONResponse
 
 
 router = APIRouter(
@@ -61,21 +62,41 @@ def get_statements(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=500, description="Maximum number of records to return"),
     active_only: bool = Query(True, description="Return only active statements"),
+    after: Optional[int] = Query(
+        None,
+        ge=0,
+        description="Return statements after this ID (keyset pagination; skip is ignored)"
+    ),
     service: StatementService = Depends(get_statement_service)
-) -> List[StatementResponse]:
+) -> UTCORJSONResponse:
     """
     Get all statements with pagination.
+    Pages can be requested by offset (skip) or, more cheaply for deep pages,
+    by passing the X-Next-Cursor header of the previous response as after.
+    Offset pages also return the total number of statements in X-Total-Count.
+    Rows come straight from the database as plain columns, so they are
+    serialized with orjson directly instead of being re-validated against
+    the response model (which still documents the payload in OpenAPI).
 
     Args:
         skip: Number of records to skip
         limit: Maximum number of records to return
         active_only: If True, return only active statements
+        after: ID of the last statement of the previous page
         service: Statement service instance
 
     Returns:
         List of statements
     """
-    return service.get_all_statements(skip=skip, limit=limit, active_only=active_only)
+    headers = {}
+    if after is not None:
+        rows = service.list_after(after_id=after, limit=limit, active_only=active_only)
+    else:
+        rows, total = service.list_page(skip=skip, limit=limit, active_only=active_only)
+        headers["X-Total-Count"] = str(total)
+    if len(rows) == limit:
+        headers["X-Next-Cursor"] = str(rows[-1]["id"])
+    return UTCORJSONResponse(content=rows, headers=headers)
 
 
 @router.get(
@@ -1,16 +1,34 @@
+import asyncio
+import threading
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
+from cachetools import TTLCache
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.repositories.user import UserRepository
 from app.repositories.magic_link import MagicLinkRepository
 from app.models.user import User
-from app.models.magic_link import MagicLink
 from app.schemas.user import UserCreate
 from app.core.security import generate_magic_link_token, create_access_token
 from app.core.email import EmailSender
 from app.config import settings
 
+# Frontend URL the magic link token is appended to, built once at import
+_MAGIC_LINK_PREFIX = f"{settings.FRONTEND_URL}/auth/verify?token="
+
+# Lifetime of a magic link
+_MAGIC_LINK_TTL = timedelta(minutes=settings.MAGIC_LINK_EXPIRE_MINUTES)
+
+# Emails that were sent a magic link recently. Repeat requests within the
+# debounce window are answered without creating another link or email.
+_recently_sent: TTLCache = TTLCache(maxsize=10000, ttl=settings.MAGIC_LINK_DEBOUNCE_SECONDS)
+_recently_sent_lock = threading.Lock()
+
+# Magic link requests currently being processed, keyed by email, so that
+# concurrent requests for the same email share a single link and email
+_inflight: Dict[str, "asyncio.Task[Tuple[bool, str]]"] = {}
+
 
 class AuthService:
     """Service layer for authentication business logic."""
@@ -28,43 +46,59 @@ class AuthService:
         self.email_sender = email_sender
         self.db = db
 
-    async def request_magic_link(self, email: str) -> Tuple[bool, str]:
+    async def request_magic_link(
+        self,
+        email: str,
+        now: Optional[datetime] = None
+    ) -> Tuple[bool, str]:
         """
         Request a magic link for authentication.
         Creates a new user if email doesn't exist.
+        Requests for an email that was sent a link within the debounce window
+        are not sent again, and concurrent requests share one send.
 
         Args:
             email: Email address to send magic link to
+            now: Current UTC time (defaults to the current time)
 
         Returns:
             Tuple of (success: bool, message: str)
         """
-        # Check if user exists
-        user = self.user_repository.get_by_email(email)
-
-        # Generate secure token
-        token = generate_magic_link_token()
+        with _recently_sent_lock:
+            if email in _recently_sent:
+                return True, "Magic link already sent"
+
+        task = _inflight.get(email)
+        if task is None:
+            task = asyncio.ensure_future(self._send_magic_link(email, now))
+            _inflight[email] = task
+            task.add_done_callback(lambda _: _inflight.pop(email, None))
+        # Shield so one caller disconnecting does not cancel the shared send
+        return await asyncio.shield(task)
+
+    async def _send_magic_link(
+        self,
+        email: str,
+        now: Optional[datetime] = None
+    ) -> Tuple[bool, str]:
+        """
+        Create a magic link and send it by email.
 
-        # Calculate expiration time
-        expires_at = datetime.utcnow() + timedelta(
-            minutes=settings.MAGIC_LINK_EXPIRE_MINUTES
-        )
+        Args:
+            email: Email address to send magic link to
+            now: Current UTC time (defaults to the current time)
 
-        # Create magic link record
-        magic_link = MagicLink(
-            token=token,
-            email=email,
-            user_id=user.id if user else None,
-            expires_at=expires_at
-        )
-        self.magic_link_repository.create(magic_link)
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        # Database work is synchronous; keep it off the event loop
+        token, username = await run_in_threadpool(self._create_magic_link, email, now)
 
         # Create magic link URL
         # For API-only backend, we'll use a frontend URL with the token
-        magic_link_url = f"{settings.FRONTEND_URL}/auth/verify?token={token}"
+        magic_link_url = _MAGIC_LINK_PREFIX + token
 
         # Send email
-        username = user.username if user else None
         success = await self.email_sender.send_magic_link(
             to_email=email,
             magic_link=magic_link_url,
@@ -72,37 +106,85 @@ class AuthService:
         )
 
         if success:
+            with _recently_sent_lock:
+                _recently_sent[email] = True
             return True, "Magic link sent successfully"
         else:
             return False, "Failed to send magic link"
 
-    def verify_magic_link(self, token: str) -> Optional[Tuple[User, str]]:
+    def _create_magic_link(
+        self,
+        email: str,
+        now: Optional[datetime] = None
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Store a new magic link for an email.
+
+        Args:
+            email: Email address the link is for
+            now: Current UTC time (defaults to the current time)
+
+        Returns:
+            Tuple of (magic link token, username of the existing user or None)
+        """
+        # Check if user exists
+        user = self.user_repository.get_by_email(email)
+
+        # Generate secure token
+        token = generate_magic_link_token()
+
+        # Calculate expiration time
+        expires_at = (now or datetime.utcnow()) + _MAGIC_LINK_TTL
+
+        # Create magic link record
+        self.magic_link_repository.create_link(
+            token=token,
+            email=email,
+            user_id=user.id if user else None,
+            expires_at=expires_at
+        )
+
+        return token, user.username if user else None
+
+    def verify_magic_link(
+        self,
+        token: str,
+        now: Optional[datetime] = None
+    ) -> Optional[Tuple[User, str]]:
         """
         Verify a magic link token and return user with JWT token.
         Creates a new user if the email doesn't exist yet.
 
         Args:
             token: Magic link token
+            now: Current UTC time (defaults to the current time)
 
         Returns:
             Tuple of (User, JWT token) or None if invalid
         """
-        # Get valid magic link
-        magic_link = self.magic_link_repository.get_valid_by_token(token)
+        if now is None:
+            now = datetime.utcnow()
+
+        # Consume the magic link; committed below together with the user
+        magic_link = self.magic_link_repository.consume(token, now)
 
         if not magic_link:
             return None
 
-        # Get or create user
-        user = self.user_repository.get_by_email(magic_link.email)
+        # Get or create user. Links for known users carry the user already;
+        # otherwise one query finds the user by email along with usernames a
+        # new user (named after the email) could collide with
+        base_username = magic_link.email.split("@")[0]
+        if magic_link.user is not None:
+            user, taken = magic_link.user, set()
+        else:
+            user, taken = self.user_repository.get_for_verification(magic_link.email, base_username)
 
         if not user:
-            # Create new user with email as username initially
-            username = magic_link.email.split("@")[0]
-            # Ensure username is unique
-            base_username = username
+            # Create new user with email as username initially, ensuring it is unique
+            username = base_username
             counter = 1
-            while self.user_repository.get_by_username(username):
+            while username in taken:
                 username = f"{base_username}{counter}"
                 counter += 1
 
@@ -111,13 +193,14 @@ class AuthService:
                 username=username,
                 is_active=True
             )
+            # Commits the consumed link in the same transaction
             user = self.user_repository.create(user)
+        else:
+            self.db.commit()
 
-        # Update last login
-        self.user_repository.update(user)
-
-        # Mark magic link as used
-        self.magic_link_repository.mark_as_used(magic_link)
+        # The link has been used; allow requesting a new one straight away
+        with _recently_sent_lock:
+            _recently_sent.pop(magic_link.email, None)
 
         # Create JWT token
         token_data = {
@@ -132,14 +215,16 @@ class AuthService:
     def get_current_user(self, user_id: int) -> Optional[User]:
         """
         Get current user by ID.
+        Served from the in-process active user cache when possible; the cache
+        entry is dropped whenever the user is updated.
 
         Args:
             user_id: User ID from JWT token
 
         Returns:
-            User instance or None if not found
+            User instance or None if not found or inactive
         """
-        return self.user_repository.get_by_id(user_id)
+        return self.user_repository.get_active_by_id(user_id)
 
     def update_user_profile(
         self,
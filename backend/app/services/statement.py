@@ -1,7 +1,7 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 
-from app.repositories.statement import StatementRepository
+from app.repositories.statement import StatementRepository, StatementRow
 from app.models.statement import Statement, StatementStatus
 from app.schemas.statement import StatementCreate, StatementUpdate
 
@@ -49,7 +49,7 @@ class StatementService:
         skip: int = 0,
         limit: int = 100,
         active_only: bool = True
-    ) -> List[Statement]:
+    ) -> List[StatementRow]:
         """
         Get all statements with pagination.
 
@@ -59,11 +59,49 @@ class StatementService:
             active_only: If True, return only active statements
 
         Returns:
-            List of Statement instances
+            List of statement rows
         """
         if active_only:
             return self.repository.get_active_statements(skip=skip, limit=limit)
-        return self.repository.get_all(skip=skip, limit=limit)
+        return self.repository.get_all_statements(skip=skip, limit=limit)
+
+    def list_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        active_only: bool = True
+    ) -> Tuple[List[StatementRow], int]:
+        """
+        Get a page of statements and the total number of statements, in one query.
+
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            active_only: If True, return only active statements
+
+        Returns:
+            Tuple of (statement rows, total number of statements)
+        """
+        return self.repository.get_statements_page(skip=skip, limit=limit, active_only=active_only)
+
+    def list_after(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 100,
+        active_only: bool = True
+    ) -> List[StatementRow]:
+        """
+        Get the next page of statements after a given ID (keyset pagination).
+
+        Args:
+            after_id: ID of the last statement of the previous page
+            limit: Maximum number of records to return
+            active_only: If True, return only active statements
+
+        Returns:
+            List of statement rows
+        """
+        return self.repository.list_after(after_id=after_id, limit=limit, active_only=active_only)
 
     def update_statement(
         self,
@@ -84,9 +122,9 @@ class StatementService:
         if not statement:
             return None
 
-        update_data = statement_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(statement, field, value)
+        # Copy only the fields the client sent, without building a dump dict
+        for field in statement_data.model_fields_set:
+            setattr(statement, field, getattr(statement_data, field))
 
         return self.repository.update(statement)
 
@@ -102,8 +140,7 @@ class StatementService:
             True if deleted successfully, False otherwise
         """
         if soft_delete:
-            result = self.repository.soft_delete(statement_id)
-            return result is not None
+            return self.repository.soft_delete(statement_id)
         return self.repository.delete(statement_id)
 
     def get_statements_by_politician(
@@ -111,7 +148,7 @@ class StatementService:
         politician_name: str,
         skip: int = 0,
         limit: int = 100
-    ) -> List[Statement]:
+    ) -> List[StatementRow]:
         """
         Get statements by politician name.
 
@@ -121,7 +158,7 @@ class StatementService:
             limit: Maximum number of records to return
 
         Returns:
-            List of Statement instances
+            List of statement rows
         """
         return self.repository.get_by_politician(politician_name, skip, limit)
 
@@ -130,7 +167,7 @@ class StatementService:
         party: str,
         skip: int = 0,
         limit: int = 100
-    ) -> List[Statement]:
+    ) -> List[StatementRow]:
         """
         Get statements by party.
 
@@ -140,7 +177,7 @@ class StatementService:
             limit: Maximum number of records to return
 
         Returns:
-            List of Statement instances
+            List of statement rows
         """
         return self.repository.get_by_party(party, skip, limit)
 
@@ -149,7 +186,7 @@ class StatementService:
         status: StatementStatus,
         skip: int = 0,
         limit: int = 100
-    ) -> List[Statement]:
+    ) -> List[StatementRow]:
         """
         Get statements by verification status.
 
@@ -159,7 +196,7 @@ class StatementService:
             limit: Maximum number of records to return
 
         Returns:
-            List of Statement instances
+            List of statement rows
         """
         return self.repository.get_by_status(status, skip, limit)
 
@@ -168,7 +205,7 @@ class StatementService:
         search_text: str,
         skip: int = 0,
         limit: int = 100
-    ) -> List[Statement]:
+    ) -> List[StatementRow]:
         """
         Search statements by text.
 
@@ -178,7 +215,7 @@ class StatementService:
             limit: Maximum number of records to return
 
         Returns:
-            List of Statement instances
+            List of statement rows
         """
         return self.repository.search_statements(search_text, skip, limit)
 
@@ -192,6 +229,4 @@ class StatementService:
         Returns:
             Number of statements
         """
-        if active_only:
-            return self.repository.count({"is_active": True})
-        return self.repository.count()
+        return self.repository.count_statements(active_only)
@@ -0,0 +1,37 @@
+-- Performance indexes declared on the models (app/models/*.py).
+--
+-- create_all only creates indexes together with their table, so databases
+-- whose tables already exist need these applied by hand. Every statement is
+-- idempotent and builds the index without blocking writes.
+--
+-- Run outside a transaction (CREATE INDEX CONCURRENTLY cannot run inside one):
+--   psql "$DATABASE_URL" -f sql/indexes.sql
+
+-- gin_trgm_ops for the trigram indexes below
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- statements: partial indexes for the active-statement listings (filter + ORDER BY id)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_statements_id_active
+    ON statements (id) WHERE is_active;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_statements_politician_name_active
+    ON statements (politician_name, id) WHERE is_active;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_statements_party_active
+    ON statements (party, id) WHERE is_active;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_statements_status_active
+    ON statements (status, id) WHERE is_active;
+
+-- statements: trigram indexes for search_statements' ILIKE '%...%'
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_statements_statement_text_trgm
+    ON statements USING gin (statement_text gin_trgm_ops) WHERE is_active;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_statements_politician_name_trgm
+    ON statements USING gin (politician_name gin_trgm_ops) WHERE is_active;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_statements_party_trgm
+    ON statements USING gin (party gin_trgm_ops) WHERE is_active;
+
+-- users: username prefix lookup (LIKE 'prefix%') when verifying new users
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_username_pattern
+    ON users (username varchar_pattern_ops);
+
+-- magic_links: periodic purge of expired links
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_magic_links_expires_at
+    ON magic_links (expires_at);
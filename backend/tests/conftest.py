@@ -0,0 +1,55 @@
+import os
+import tempfile
+from typing import Generator, Iterator
+
+import pytest
+
+# Settings are read when app.database is imported; point the application at a
+# throwaway SQLite file before any app module is loaded
+_db_dir = tempfile.mkdtemp(prefix="polito-log-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+os.environ["DEBUG"] = "False"
+
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.database import Base, SessionLocal, engine  # noqa: E402
+import app.models  # noqa: E402,F401  (registers all tables on Base.metadata)
+from app.core import security  # noqa: E402
+from app.repositories import magic_link, statement, user  # noqa: E402
+from app.services import auth  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def reset_caches() -> Iterator[None]:
+    """
+    Empty the in-process caches around every test.
+    Each test rebuilds the schema, so primary keys are handed out again and
+    cached entries from an earlier test would otherwise resolve to new rows.
+    """
+    caches = [
+        user._active_user_cache,
+        user._email_to_id_cache,
+        magic_link._invalid_token_cache,
+        statement._status_rows_cache,
+        statement._count_cache,
+        auth._recently_sent,
+        auth._inflight,
+        security._jwt_cache,
+    ]
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+
+
+@pytest.fixture
+def db() -> Generator[Session, None, None]:
+    """Database session on a freshly created schema."""
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
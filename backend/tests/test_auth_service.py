@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.core.email import ConsoleEmailSender
+from app.models.user import User
+from app.repositories.magic_link import MagicLinkRepository
+from app.services.auth import AuthService
+from tests.utils import count_queries
+
+
+def _create_link(db: Session, token: str, email: str, user_id=None) -> datetime:
+    now = datetime.utcnow()
+    MagicLinkRepository(db).create_link(
+        token=token,
+        email=email,
+        user_id=user_id,
+        expires_at=now + timedelta(minutes=15)
+    )
+    db.commit()
+    return now
+
+
+def test_verify_magic_link_for_new_user_is_bounded(db):
+    now = _create_link(db, "new-user-token", "new.user@example.com")
+    service = AuthService(db, ConsoleEmailSender())
+
+    with count_queries() as queries:
+        result = service.verify_magic_link("new-user-token", now)
+
+    assert result is not None
+    user, access_token = result
+    assert user.email == "new.user@example.com"
+    assert user.username == "new.user"
+    assert access_token
+    assert len(queries) <= 3, queries
+
+
+def test_verify_magic_link_resolves_username_collisions_in_one_query(db):
+    db.add_all([
+        User(email="new.user@other.org", username="new.user", is_active=True),
+        User(email="new.user@third.org", username="new.user1", is_active=True),
+        User(email="someone@example.com", username="new.username", is_active=True),
+    ])
+    db.commit()
+    now = _create_link(db, "collision-token", "new.user@example.com")
+    service = AuthService(db, ConsoleEmailSender())
+
+    with count_queries() as queries:
+        result = service.verify_magic_link("collision-token", now)
+
+    assert result is not None
+    user, _ = result
+    assert user.username == "new.user2"
+    assert len(queries) <= 3, queries
+
+
+def test_verify_magic_link_for_existing_user_skips_user_lookup(db, monkeypatch):
+    existing = User(email="known@example.com", username="known", is_active=True)
+    db.add(existing)
+    db.commit()
+    user_id = existing.id
+    now = _create_link(db, "known-user-token", "known@example.com", user_id=user_id)
+    db.expunge_all()
+    service = AuthService(db, ConsoleEmailSender())
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the link's user should be used without a second lookup")
+
+    monkeypatch.setattr(service.user_repository, "get_for_verification", fail)
+    monkeypatch.setattr(service.user_repository, "get_by_email", fail)
+
+    with count_queries() as queries:
+        result = service.verify_magic_link("known-user-token", now)
+
+    assert result is not None
+    user, _ = result
+    assert user.id == user_id
+    assert user.username == "known"
+    # The consume UPDATE ... RETURNING and the user it loads with it
+    assert len(queries) <= 2, queries
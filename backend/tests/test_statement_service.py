@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta, timezone
+
+from app.models.statement import Statement
+from app.schemas.statement import StatementCreate
+from app.services.statement import StatementService
+from tests.utils import count_queries
+
+
+def _statement(index: int, is_active: bool = True) -> Statement:
+    return Statement(
+        politician_name=f"Politician {index}",
+        party="Party",
+        statement_text=f"Statement {index}",
+        statement_date=datetime(2024, 1, 1),
+        is_active=is_active
+    )
+
+
+def test_list_page_uses_one_query(db):
+    db.add_all([_statement(i) for i in range(5)] + [_statement(5, is_active=False)])
+    db.commit()
+    service = StatementService(db)
+
+    with count_queries() as queries:
+        rows, total = service.list_page(skip=1, limit=2)
+
+    assert [row["statement_text"] for row in rows] == ["Statement 1", "Statement 2"]
+    assert total == 5
+    assert len(queries) == 1, queries
+
+
+def test_get_all_statements_is_bounded(db):
+    db.add_all([_statement(i) for i in range(20)] + [_statement(20, is_active=False)])
+    db.commit()
+    service = StatementService(db)
+
+    with count_queries() as queries:
+        active = service.get_all_statements()
+        everything = service.get_all_statements(active_only=False)
+
+    assert len(active) == 20
+    assert len(everything) == 21
+    assert len(queries) <= 2, queries
+
+
+def test_create_statement_returns_stored_datetimes(db):
+    data = StatementCreate(
+        politician_name="Politician",
+        party="Party",
+        statement_text="Statement",
+        statement_date=datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=3)))
+    )
+
+    created = StatementService(db).create_statement(data)
+    db.expunge_all()
+    stored = StatementService(db).get_statement_by_id(created.id)
+
+    assert created.statement_date == stored.statement_date
+    assert created.statement_date.tzinfo == stored.statement_date.tzinfo
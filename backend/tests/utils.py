@@ -0,0 +1,35 @@
+from contextlib import contextmanager
+from typing import Iterator, List, Union
+
+from sqlalchemy import Connection, Engine, event
+
+from app.database import engine
+
+
+@contextmanager
+def count_queries(bind: Union[Engine, Connection] = engine) -> Iterator[List[str]]:
+    """
+    Record the SQL statements executed through an engine or connection.
+    Lets tests assert that a code path issues a bounded number of queries.
+
+    Args:
+        bind: Engine or connection to watch (defaults to the application engine)
+
+    Yields:
+        List that collects each executed SQL statement
+
+    Usage:
+        with count_queries() as queries:
+            service.verify_magic_link(token)
+        assert len(queries) <= 3
+    """
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(bind, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "before_cursor_execute", record)